@@ -1,11 +1,26 @@
 #!/usr/bin/env python
+import asyncio
+import atexit
 import os
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Tuple
 
 import gradio as gr
-import requests
+import httpx
+import msgspec
+import orjson
 from dotenv import load_dotenv
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 # Load .env
 load_dotenv()
@@ -14,83 +29,253 @@ API_TOKEN = os.getenv("API_TOKEN", "")
 
 
 # ----------------------------------------------------------------------
-# Request helpers (add bearer token)
+# Request helpers (shared async client, bearer token baked in)
 # ----------------------------------------------------------------------
 def _auth_headers(token: str) -> Dict[str, str]:
     return {"Authorization": f"Bearer {token}"} if token else {}
 
 
-def _request(method: str, url: str, token: str, **kwargs) -> requests.Response:
-    headers = kwargs.pop("headers", {})
-    headers.update(_auth_headers(token))
-    return requests.request(method, url, headers=headers, **kwargs)
+# One long-lived client: connections are reused across requests (no
+# per-click TCP/TLS handshake) and HTTP/2 multiplexes concurrent calls
+# over a single session where the backend supports it. The transport
+# retries connection establishment, which is safe for any method since
+# nothing has been sent yet.
+_transport = httpx.AsyncHTTPTransport(
+    retries=3,
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30),
+)
+_client = httpx.AsyncClient(
+    base_url=API_URL,
+    headers=_auth_headers(API_TOKEN),
+    timeout=httpx.Timeout(30.0, read=120.0),
+    transport=_transport,
+)
+
+
+@atexit.register
+def _close_client() -> None:
+    try:
+        asyncio.run(_client.aclose())
+    except Exception:
+        pass
+
+
+async def _warm_connection_pool() -> None:
+    """Open a keep-alive connection to the backend before any user click.
+
+    Run at server startup so the first real request skips DNS + TCP + TLS
+    setup; failures are ignored (the backend may simply not be up yet).
+    """
+    try:
+        await _client.head("/", timeout=5)
+    except Exception:
+        pass
+
+
+@asynccontextmanager
+async def _lifespan(app):
+    # Passed through launch(app_kwargs=...); Gradio wraps this around its
+    # own lifespan, so it actually runs at server startup — FastAPI-style
+    # on_startup handlers are silently ignored once a lifespan exists.
+    await _warm_connection_pool()
+    yield
+
+
+_RETRYABLE_STATUS = frozenset({502, 503, 504})
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, httpx.TransportError):
+        return True
+    return (
+        isinstance(exc, httpx.HTTPStatusError)
+        and exc.response.status_code in _RETRYABLE_STATUS
+    )
+
+
+async def _request(method: str, path: str, **kwargs) -> httpx.Response:
+    # Only GETs are retried after the request has been sent — re-sending a
+    # POST/DELETE on a flaky connection could duplicate its side effects.
+    if method != "GET":
+        return await _client.request(method, path, **kwargs)
+    async for attempt in AsyncRetrying(
+        retry=retry_if_exception(_is_retryable),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential_jitter(0.2, 2.0),
+        reraise=True,
+    ):
+        with attempt:
+            r = await _client.request(method, path, **kwargs)
+            if r.status_code in _RETRYABLE_STATUS:
+                r.raise_for_status()
+            return r
+
+
+# JSON bodies are serialized with orjson (bytes out, no intermediate str)
+# instead of httpx's stdlib-json `json=` path.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+# ----------------------------------------------------------------------
+# Tiny TTL cache for the hot list endpoints (notes/quizzes are fetched
+# from several tabs per UI action; no point re-hitting the backend)
+# ----------------------------------------------------------------------
+_CACHE_TTL = 3.0  # seconds
+_cache: Dict[str, Tuple[float, Any]] = {}
+_inflight: Dict[str, asyncio.Future] = {}
+
+
+async def _cached_get(key: str, fetch, ttl: float = _CACHE_TTL) -> Any:
+    now = time.monotonic()
+    hit = _cache.get(key)
+    if hit and now - hit[0] < ttl:
+        return hit[1]
+    # Coalesce concurrent misses for the same key onto one backend call;
+    # later callers just await the first caller's future.
+    fut = _inflight.get(key)
+    if fut is not None:
+        return await fut
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[key] = fut
+    try:
+        data = await fetch()
+    except BaseException as exc:
+        fut.set_exception(exc)
+        fut.exception()  # mark retrieved in case nobody else is waiting
+        raise
+    finally:
+        _inflight.pop(key, None)
+    fut.set_result(data)
+    _cache[key] = (time.monotonic(), data)
+    return data
+
+
+def _invalidate(*keys: str) -> None:
+    for key in keys:
+        _cache.pop(key, None)
+
+
+# Per-note memo of built concept rows, LRU-evicted so it stays bounded.
+# Dropped for a note when it is re-processed or deleted.
+_CONCEPTS_CACHE_MAX = 32
+_concepts_cache: OrderedDict = OrderedDict()
+
+# Concepts are rendered a page at a time so time-to-first-row on huge
+# notes is bounded by the page size, not the concept count.
+_CONCEPT_PAGE = 200
 
 
 # ----------------------------------------------------------------------
-# API wrappers (unchanged)
+# Typed response models — msgspec decodes straight from response bytes
+# into attribute-access structs, skipping the intermediate dicts
 # ----------------------------------------------------------------------
-def upload_file(
-    api_url: str, token: str, file_path: str, content_type: str
-) -> Tuple[bool, str]:
+class SRSInfo(msgspec.Struct):
+    stability: float | None = None
+    difficulty: float | None = None
+    due: str = ""
+    last_review: str = ""
+
+
+class Concept(msgspec.Struct):
+    name: str = ""
+    content: str = ""
+    srs_info: SRSInfo = msgspec.field(default_factory=SRSInfo)
+
+
+class QuizQuestion(msgspec.Struct):
+    question: str = ""
+    response: str = ""
+    grade: int | None = None
+    feedback: str = ""
+
+
+class Quiz(msgspec.Struct):
+    id: str = ""
+    name: str | None = None
+    status: str = ""
+    questions: List[QuizQuestion] = msgspec.field(default_factory=list)
+
+
+# ----------------------------------------------------------------------
+# API wrappers (async; base URL + token come from the shared client)
+# ----------------------------------------------------------------------
+async def upload_file(file_path: str, content_type: str) -> Tuple[bool, str]:
     if not file_path:
         return False, "❌ No file selected."
 
     filename = os.path.basename(file_path)
     mime = f"application/{content_type}"
     try:
+        # Hand httpx the open handle, never the read() bytes: its multipart
+        # encoder iterates the file in chunks, so a large upload is streamed
+        # with constant memory while Content-Length is still computed up
+        # front from the file size (letting the server preflight-reject
+        # oversized uploads).
         with open(file_path, "rb") as f:
-            files = {"file": (filename, f, mime)}
-            data = {"content_type": content_type}
-            r = _request("POST", f"{api_url}/notes", token, files=files, data=data)
+            r = await _request(
+                "POST",
+                "/notes",
+                files={"file": (filename, f, mime)},
+                data={"content_type": content_type},
+            )
             r.raise_for_status()
-            return True, r.json()["note_id"]
+            return True, orjson.loads(r.content)["note_id"]
     except Exception as exc:
         return False, f"❌ {exc}"
 
 
-def upload_text(api_url: str, token: str, name: str, content: str) -> Tuple[bool, str]:
+async def upload_text(name: str, content: str) -> Tuple[bool, str]:
     if not name or not content:
         return False, "❌ Both name and content are required."
     payload = {"name": name, "content": content}
     try:
-        r = _request("POST", f"{api_url}/notes/text", token, json=payload)
+        r = await _request(
+            "POST", "/notes/text", content=orjson.dumps(payload), headers=_JSON_HEADERS
+        )
         r.raise_for_status()
-        return True, r.json()["note_id"]
+        return True, orjson.loads(r.content)["note_id"]
     except Exception as exc:
         return False, f"❌ {exc}"
 
 
-def list_notes(api_url: str, token: str) -> List[Tuple[str, str, str]]:
-    r = _request("GET", f"{api_url}/notes", token)
-    r.raise_for_status()
-    return [(n["id"], n["name"], n["status"]) for n in r.json()]
+async def list_notes() -> List[Tuple[str, str, str, Tuple[str, str]]]:
+    async def fetch():
+        r = await _request("GET", "/notes")
+        r.raise_for_status()
+        # Build the dropdown (label, id) choice here, once per fetch, so
+        # refresh handlers across all tabs just reuse it.
+        return [
+            (n["id"], n["name"], n["status"], _format_note_choice(n["id"], n["name"]))
+            for n in orjson.loads(r.content)
+        ]
+
+    return await _cached_get("notes", fetch)
 
 
-def get_note_content(api_url: str, token: str, note_id: str) -> str:
-    r = _request("GET", f"{api_url}/notes/{note_id}", token)
+async def get_note_content(note_id: str) -> str:
+    r = await _request("GET", f"/notes/{note_id}")
     r.raise_for_status()
-    return r.json()["content"]
+    return orjson.loads(r.content)["content"]
 
 
-def process_note(api_url: str, token: str, note_id: str) -> Tuple[bool, str]:
+async def process_note(note_id: str) -> Tuple[bool, str]:
     try:
-        r = _request("POST", f"{api_url}/notes/{note_id}/process", token, timeout=120)
+        r = await _request("POST", f"/notes/{note_id}/process", timeout=120)
         r.raise_for_status()
-        msg = r.json()
+        msg = orjson.loads(r.content)
         return True, f"✅ Generated {msg['concepts_generated']} concepts."
     except Exception as exc:
         return False, f"❌ {exc}"
 
 
-def list_concepts(api_url: str, token: str, note_id: str) -> List[Dict[str, Any]]:
-    r = _request("GET", f"{api_url}/notes/{note_id}/concepts", token)
+async def list_concepts(note_id: str) -> List[Concept]:
+    r = await _request("GET", f"/notes/{note_id}/concepts")
     r.raise_for_status()
-    return r.json()
+    return msgspec.json.decode(r.content, type=List[Concept])
 
 
-def create_quiz(
-    api_url: str,
-    token: str,
+async def create_quiz(
     note_ids: List[str],
     concept_limit: int,
     question_limit: int,
@@ -103,79 +288,112 @@ def create_quiz(
         "mode": mode,
     }
     try:
-        r = _request("POST", f"{api_url}/quizzes", token, json=payload)
+        r = await _request(
+            "POST", "/quizzes", content=orjson.dumps(payload), headers=_JSON_HEADERS
+        )
         r.raise_for_status()
-        return True, r.json()
+        return True, orjson.loads(r.content)
     except Exception as exc:
         return False, f"❌ {exc}"
 
 
-def submit_quiz(
-    api_url: str, token: str, quiz_id: str, responses: List[str]
-) -> Tuple[bool, Dict[str, Any]]:
+async def submit_quiz(quiz_id: str, responses: List[str]) -> Tuple[bool, Dict[str, Any]]:
     payload = {"responses": responses}
     try:
-        r = _request("POST", f"{api_url}/quizzes/{quiz_id}/submit", token, json=payload)
+        r = await _request(
+            "POST",
+            f"/quizzes/{quiz_id}/submit",
+            content=orjson.dumps(payload),
+            headers=_JSON_HEADERS,
+        )
         r.raise_for_status()
-        return True, r.json()
+        return True, orjson.loads(r.content)
     except Exception as exc:
         return False, f"❌ {exc}"
 
 
-def delete_note(api_url: str, token: str, note_id: str) -> Tuple[bool, str]:
+async def delete_note(note_id: str) -> Tuple[bool, str]:
     try:
-        r = _request("DELETE", f"{api_url}/notes/{note_id}", token)
+        r = await _request("DELETE", f"/notes/{note_id}")
         r.raise_for_status()
-        return True, r.json()
+        return True, orjson.loads(r.content)
     except Exception as exc:
         return False, f"❌ {exc}"
 
 
-def list_quizzes(api_url: str, token: str) -> List[Dict[str, Any]]:
-    r = _request("GET", f"{api_url}/quizzes", token)
-    r.raise_for_status()
-    return r.json()
+async def list_quizzes() -> List[Quiz]:
+    async def fetch():
+        r = await _request("GET", "/quizzes")
+        r.raise_for_status()
+        return msgspec.json.decode(r.content, type=List[Quiz])
+
+    return await _cached_get("quizzes", fetch)
 
 
-def get_quiz_by_id(api_url: str, token: str, quiz_id: str) -> Dict[str, Any]:
-    r = _request("GET", f"{api_url}/quizzes/{quiz_id}", token)
+async def get_quiz_by_id(quiz_id: str) -> Quiz:
+    r = await _request("GET", f"/quizzes/{quiz_id}")
     r.raise_for_status()
-    return r.json()
+    return msgspec.json.decode(r.content, type=Quiz)
 
 
 # ----------------------------------------------------------------------
 # Small UI helper utilities
 # ----------------------------------------------------------------------
-def _format_note_choice(row: Tuple[str, str, str]) -> str:
-    """Display label for a note dropdown: Name — ID"""
-    nid, name, _status = row
-    # Name first, then ID so display is readable but ID is easily extractable.
-    return f"{name} — {nid}"
+# Difficulty arrives as 1..10; show it as a percentage in one multiply.
+_DIFF_SCALE = 100.0 / 9.0
+
+
+def _iso_date(x: str) -> str:
+    """YYYY-MM-DD from an ISO-8601 timestamp, without a full datetime parse."""
+    if not x:
+        return ""
+    if len(x) >= 10 and x[4] == "-" and x[7] == "-":
+        return x[:10]
+    return datetime.fromisoformat(x).strftime("%Y-%m-%d")
+
+
+def _fmt_stability(s: SRSInfo) -> str:
+    x = s.stability
+    return "" if not x else str(round(float(x), 2))
 
 
-def _format_note_choices(rows: List[Tuple[str, str, str]]) -> List[str]:
-    return [_format_note_choice(r) for r in rows]
+def _fmt_difficulty(s: SRSInfo) -> str:
+    x = s.difficulty
+    return "" if not x else str(round((float(x) - 1) * _DIFF_SCALE, 2))
 
 
-def _format_quiz_choice(q: Dict[str, Any]) -> str:
-    """Readable quiz label; embed the id at the end for extraction."""
-    qid = q.get("id", "")
-    qname = q.get("name") or f"Quiz {qid[:8]}"
-    return f"{qname} — {qid}"
+def _concept_rows(raw: List[Concept]) -> List[List[str]]:
+    """Concept table rows; a single comprehension keeps the hot loop tight."""
+    return [
+        [
+            c.name,
+            c.content,
+            _fmt_stability(c.srs_info),
+            _fmt_difficulty(c.srs_info),
+            _iso_date(c.srs_info.due),
+            _iso_date(c.srs_info.last_review),
+        ]
+        for c in raw
+    ]
 
 
-def _extract_id_from_display(sel: Optional[str]) -> Optional[str]:
-    if not sel:
-        return None
-    if " — " in sel:
-        return sel.split(" — ")[-1]
-    return sel
+def _format_note_choice(nid: str, name: str) -> Tuple[str, str]:
+    """(label, value) pair for a note dropdown: readable label, raw id value."""
+    # Gradio passes the value (the id) straight to callbacks — no parsing.
+    return f"{name} — {nid}", nid
 
 
-def _extract_ids_from_display_list(sel_list: Optional[List[str]]) -> List[str]:
-    if not sel_list:
-        return []
-    return [s.split(" — ")[-1] if " — " in s else s for s in sel_list]
+def _format_note_choices(
+    rows: List[Tuple[str, str, str, Tuple[str, str]]],
+) -> List[Tuple[str, str]]:
+    """Choices are precomputed on the fetch path; just project them out."""
+    return [n[3] for n in rows]
+
+
+def _format_quiz_choice(q: Quiz) -> Tuple[str, str]:
+    """(label, value) pair for a quiz dropdown."""
+    qname = q.name or f"Quiz {q.id[:8]}"
+    return f"{qname} — {q.id}", q.id
 
 
 # ----------------------------------------------------------------------
@@ -183,9 +401,18 @@ def _extract_ids_from_display_list(sel_list: Optional[List[str]]) -> List[str]:
 # ----------------------------------------------------------------------
 with gr.Blocks(title="ConceptCycle", theme=gr.themes.Ocean()) as client:
     # only store dynamic UI state here (last ids). API URL + token come from .env
-    cfg_state = gr.State({"last_note_id": None, "last_quiz_id": None})
+    cfg_state = gr.State(
+        {
+            "last_note_id": None,
+            "last_quiz_id": None,
+            "notes": [],
+            "concept_note_id": None,
+            "concept_offset": 0,
+        }
+    )
 
     gr.Markdown("# ConceptCycle")
+    refresh_all_btn = gr.Button("🔄 Refresh everything", variant="secondary")
     # gr.Markdown(
     #     f"**Loaded .env**  \nAPI base URL: `{API_URL}`  \nToken present: {'✅' if API_TOKEN else '❌ (not set)'}"
     # )
@@ -218,6 +445,9 @@ with gr.Blocks(title="ConceptCycle", theme=gr.themes.Ocean()) as client:
             notes_df = gr.Dataframe(
                 headers=["Name", "Status"],
                 datatype=["str", "str"],
+                row_count=(0, "dynamic"),
+                col_count=("fixed", 2),
+                max_height=500,
                 interactive=False,
                 label="Your notes",
                 wrap=True,
@@ -242,8 +472,9 @@ with gr.Blocks(title="ConceptCycle", theme=gr.themes.Ocean()) as client:
                 delete_status = gr.Textbox(label="Delete result", interactive=False)
 
         # file upload callback (uses dotenv API_URL / API_TOKEN)
-        def _upload_file(_cfg, fpath, ftype):
-            ok, out = upload_file(API_URL, API_TOKEN, fpath, ftype)
+        async def _upload_file(_cfg, fpath, ftype):
+            ok, out = await upload_file(fpath, ftype)
+            _invalidate("notes")
             return out if ok else f"❌ {out}"
 
         upload_file_btn.click(
@@ -253,8 +484,9 @@ with gr.Blocks(title="ConceptCycle", theme=gr.themes.Ocean()) as client:
         )
 
         # text upload
-        def _upload_txt(_cfg, name, cont):
-            ok, out = upload_text(API_URL, API_TOKEN, name, cont)
+        async def _upload_txt(_cfg, name, cont):
+            ok, out = await upload_text(name, cont)
+            _invalidate("notes")
             return out if ok else f"❌ {out}"
 
         upload_txt_btn.click(
@@ -263,27 +495,12 @@ with gr.Blocks(title="ConceptCycle", theme=gr.themes.Ocean()) as client:
             outputs=upload_txt_status,
         )
 
-        # Refresh notes (notes table + selected_note dropdown)
-        def _refresh_notes(_cfg):
-            notes = list_notes(API_URL, API_TOKEN)
-            rows = [[n[1], n[2]] for n in notes]
-            choices = _format_note_choices(notes)
-            selected_val = choices[0] if choices else None
-            return rows, gr.update(choices=choices, value=selected_val)
-
-        list_notes_btn.click(
-            _refresh_notes,
-            inputs=cfg_state,
-            outputs=[notes_df, selected_note],
-        )
-
         # show raw content
-        def _show_content(_cfg, sel_note_display):
-            nid = _extract_id_from_display(sel_note_display)
+        async def _show_content(_cfg, nid):
             if not nid:
                 return "⚠️ No note selected."
             try:
-                return get_note_content(API_URL, API_TOKEN, nid)
+                return await get_note_content(nid)
             except Exception as exc:
                 return f"❌ {exc}"
 
@@ -294,11 +511,13 @@ with gr.Blocks(title="ConceptCycle", theme=gr.themes.Ocean()) as client:
         )
 
         # process note
-        def _process(cfg, sel_note_display):
-            nid = _extract_id_from_display(sel_note_display)
+        async def _process(cfg, nid):
             if not nid:
                 return "⚠️ No note selected.", cfg
-            ok, msg = process_note(API_URL, API_TOKEN, nid)
+            ok, msg = await process_note(nid)
+            _invalidate("notes")
+            if ok:
+                _concepts_cache.pop(nid, None)
             new_cfg = cfg.copy()
             new_cfg["last_note_id"] = nid if ok else cfg.get("last_note_id")
             return msg, new_cfg
@@ -310,23 +529,29 @@ with gr.Blocks(title="ConceptCycle", theme=gr.themes.Ocean()) as client:
         )
 
         # delete note (refreshes table + selected dropdown)
-        def _delete_note(cfg, sel_note_display):
-            nid = _extract_id_from_display(sel_note_display)
+        async def _delete_note(cfg, nid):
             if not nid:
-                return "⚠️ No note selected.", [], gr.update(choices=[], value=None)
-            ok, msg = delete_note(API_URL, API_TOKEN, nid)
+                return "⚠️ No note selected.", cfg, gr.update(), gr.update()
+            ok, msg = await delete_note(nid)
+            _invalidate("notes")
+            _concepts_cache.pop(nid, None)
             if not ok:
-                return f"❌ {msg}", [], gr.update(choices=[], value=None)
-            notes = list_notes(API_URL, API_TOKEN)
-            rows = [[n[0], n[1], n[2]] for n in notes]
+                return f"❌ {msg}", cfg, gr.update(), gr.update()
+            # Drop the row locally instead of re-fetching the whole list; the
+            # TTL cache was invalidated above so the next explicit refresh
+            # reconciles with the server.
+            notes = [n for n in cfg.get("notes", []) if n[0] != nid]
+            new_cfg = cfg.copy()
+            new_cfg["notes"] = notes
+            rows = [[n[1], n[2]] for n in notes]
             choices = _format_note_choices(notes)
             upd_selected = gr.update(choices=choices, value=None)
-            return "✅ Note deleted.", rows, upd_selected
+            return "✅ Note deleted.", new_cfg, rows, upd_selected
 
         delete_btn.click(
             _delete_note,
             inputs=[cfg_state, selected_note],
-            outputs=[delete_status, notes_df, selected_note],
+            outputs=[delete_status, cfg_state, notes_df, selected_note],
         )
 
     # -----------------------
@@ -340,17 +565,6 @@ with gr.Blocks(title="ConceptCycle", theme=gr.themes.Ocean()) as client:
         )
         refresh_concept_notes = gr.Button("Refresh notes")
 
-        def _refresh_concept(_cfg):
-            notes = list_notes(API_URL, API_TOKEN)
-            choices = _format_note_choices(notes)
-            return gr.update(choices=choices, value=choices[0] if choices else None)
-
-        refresh_concept_notes.click(
-            _refresh_concept,
-            inputs=cfg_state,
-            outputs=concept_note_selector,
-        )
-
         concepts_df = gr.Dataframe(
             headers=[
                 "Name",
@@ -360,48 +574,72 @@ with gr.Blocks(title="ConceptCycle", theme=gr.themes.Ocean()) as client:
                 "Due",
                 "Last review",
             ],
-            datatype=["str"] * 10,
+            # All six columns stay "str": Gradio's "date" column type makes
+            # the dataframe render pathologically slowly (cost scales with
+            # total cells, not just date cells) — don't reintroduce it.
+            datatype=["str", "str", "str", "str", "str", "str"],
+            row_count=(0, "dynamic"),
+            col_count=("fixed", 6),
+            max_height=500,
             interactive=False,
             label="Concepts for the selected note",
-            wrap=True,
+            # Keep row heights uniform (no wrapping of long concept content)
+            # so only the visible rows are ever laid out.
+            wrap=False,
         )
+        load_more_concepts_btn = gr.Button("Load more concepts", interactive=False)
+
+        async def _get_concept_rows(nid):
+            if nid in _concepts_cache:
+                _concepts_cache.move_to_end(nid)
+                return _concepts_cache[nid]
+            raw = await list_concepts(nid)
+            rows = _concept_rows(raw)
+            _concepts_cache[nid] = rows
+            while len(_concepts_cache) > _CONCEPTS_CACHE_MAX:
+                _concepts_cache.popitem(last=False)
+            return rows
 
-        def _load_concepts(_cfg, sel_note_display):
-            nid = _extract_id_from_display(sel_note_display)
+        async def _load_concepts(cfg, nid):
+            # Re-selecting the already-displayed note is a no-op unless its
+            # memoized rows were invalidated (re-process/delete) meanwhile.
+            if (
+                nid
+                and nid == cfg.get("concept_note_id")
+                and cfg.get("concept_offset")
+                and nid in _concepts_cache
+            ):
+                return gr.update(), cfg, gr.update()
+            new_cfg = cfg.copy()
+            new_cfg["concept_note_id"] = nid
+            new_cfg["concept_offset"] = 0
             if not nid:
-                return []
-            raw = list_concepts(API_URL, API_TOKEN, nid)
-            rows = []
-            for c in raw:
-                s = c.get("srs_info", {})
-                rows.append(
-                    [
-                        c.get("name", ""),
-                        c.get("content", ""),
-                        "" if not (x := s.get("stability")) else round(float(x), 2),
-                        (
-                            ""
-                            if not (x := s.get("difficulty"))
-                            else round(((float(x) - 1) / 9) * 100, 2)
-                        ),
-                        (
-                            ""
-                            if not (x := s.get("due", ""))
-                            else datetime.fromisoformat(x).strftime("%Y-%m-%d")
-                        ),
-                        (
-                            ""
-                            if not (x := s.get("last_review", ""))
-                            else datetime.fromisoformat(x).strftime("%Y-%m-%d")
-                        ),
-                    ]
-                )
-            return rows
+                return [], new_cfg, gr.update(interactive=False)
+            rows = await _get_concept_rows(nid)
+            page = rows[:_CONCEPT_PAGE]
+            new_cfg["concept_offset"] = len(page)
+            return page, new_cfg, gr.update(interactive=len(rows) > len(page))
+
+        async def _load_more_concepts(cfg):
+            nid = cfg.get("concept_note_id")
+            if not nid:
+                return gr.update(), cfg, gr.update(interactive=False)
+            rows = await _get_concept_rows(nid)
+            page = rows[: cfg.get("concept_offset", 0) + _CONCEPT_PAGE]
+            new_cfg = cfg.copy()
+            new_cfg["concept_offset"] = len(page)
+            return page, new_cfg, gr.update(interactive=len(rows) > len(page))
 
         concept_note_selector.change(
             _load_concepts,
             inputs=[cfg_state, concept_note_selector],
-            outputs=concepts_df,
+            outputs=[concepts_df, cfg_state, load_more_concepts_btn],
+        )
+
+        load_more_concepts_btn.click(
+            _load_more_concepts,
+            inputs=cfg_state,
+            outputs=[concepts_df, cfg_state, load_more_concepts_btn],
         )
 
     # -----------------------
@@ -416,17 +654,6 @@ with gr.Blocks(title="ConceptCycle", theme=gr.themes.Ocean()) as client:
         )
         refresh_quiz_notes = gr.Button("Refresh notes")
 
-        def _refresh_quiz_notes(_cfg):
-            notes = list_notes(API_URL, API_TOKEN)
-            choices = _format_note_choices(notes)
-            return gr.update(choices=choices, value=None)
-
-        refresh_quiz_notes.click(
-            _refresh_quiz_notes,
-            inputs=cfg_state,
-            outputs=quiz_note_selector,
-        )
-
         with gr.Row():
             concept_limit_n = gr.Slider(1, 20, value=5, step=1, label="Concept limit")
             question_limit_n = gr.Slider(
@@ -447,40 +674,30 @@ with gr.Blocks(title="ConceptCycle", theme=gr.themes.Ocean()) as client:
         )
         refresh_active_quizzes_btn = gr.Button("Refresh active quizzes")
 
-        def _refresh_active_quizzes(_cfg):
-            quizzes = [
-                q
-                for q in list_quizzes(API_URL, API_TOKEN)
-                if q.get("status") == "active"
-            ]
-            choices = [_format_quiz_choice(q) for q in quizzes]
-            return gr.update(choices=choices, value=choices[0] if choices else None)
-
-        refresh_active_quizzes_btn.click(
-            _refresh_active_quizzes,
-            inputs=cfg_state,
-            outputs=active_quiz_selector,
-        )
-
         active_quiz_df = gr.Dataframe(
             headers=["question", "answer"],
             datatype=["str", "str"],
+            row_count=(0, "dynamic"),
+            col_count=("fixed", 2),
+            max_height=500,
             interactive=True,
             label="Answer the questions below (type in the “answer” column)",
         )
         submit_quiz_btn = gr.Button("Submit answers", variant="primary")
         submit_result_box = gr.JSON(label="Grading result")
 
-        def _create_quiz(cfg, sel_note_displays, climit, qlimit, mode):
-            note_ids = _extract_ids_from_display_list(sel_note_displays)
+        async def _create_quiz(cfg, sel_note_ids, climit, qlimit, mode):
+            note_ids = sel_note_ids or []
             if not note_ids:
                 return {"error": "Select at least one note."}, gr.update(value=[])
-            ok, out = create_quiz(API_URL, API_TOKEN, note_ids, climit, qlimit, mode)
+            ok, out = await create_quiz(note_ids, climit, qlimit, mode)
+            _invalidate("quizzes")
             if not ok:
                 return {"error": out}, gr.update(value=[])
             new_cfg = cfg.copy()
             new_cfg["last_quiz_id"] = out["id"]
             rows = [[q["question"], ""] for q in out.get("questions", [])]
+            new_cfg["last_quiz_rows"] = rows
             return out, gr.update(value=rows), new_cfg
 
         create_quiz_btn.click(
@@ -499,17 +716,19 @@ with gr.Blocks(title="ConceptCycle", theme=gr.themes.Ocean()) as client:
             ],
         )
 
-        def _load_active_quiz(cfg, sel_q_display):
-            if not sel_q_display:
+        async def _load_active_quiz(cfg, qid):
+            if not qid:
                 return gr.update(value=[]), cfg
-            qid = _extract_id_from_display(sel_q_display)
-            data = get_quiz_by_id(API_URL, API_TOKEN, qid)
+            # Gradio re-fires .change when the same value is re-set
+            # programmatically; don't refetch/re-render an unchanged quiz.
+            if qid == cfg.get("last_quiz_id") and cfg.get("last_quiz_rows"):
+                return gr.update(), cfg
+            data = await get_quiz_by_id(qid)
             new_cfg = cfg.copy()
             new_cfg["last_quiz_id"] = qid
-            rows = []
-            readonly = data.get("status") != "active"
-            for q in data.get("questions", []):
-                rows.append([q.get("question", ""), ""])
+            rows = [[q.question, ""] for q in data.questions]
+            new_cfg["last_quiz_rows"] = rows
+            readonly = data.status != "active"
             df_update = gr.update(value=rows, interactive=not readonly)
             return df_update, new_cfg
 
@@ -519,10 +738,10 @@ with gr.Blocks(title="ConceptCycle", theme=gr.themes.Ocean()) as client:
             outputs=[active_quiz_df, cfg_state],
         )
 
-        def _submit_quiz(cfg, df):
+        async def _submit_quiz(cfg, df):
             quiz_id = cfg.get("last_quiz_id")
             if not quiz_id:
-                return {"error": "No quiz loaded in this session."}
+                return {"error": "No quiz loaded in this session."}, cfg
             answers = []
             try:
                 if hasattr(df, "answer"):
@@ -532,14 +751,24 @@ with gr.Blocks(title="ConceptCycle", theme=gr.themes.Ocean()) as client:
             except Exception:
                 answers = []
             if not answers or not all(map(bool, answers)):
-                return {"error": "All questions must be attempted before submission"}
-            ok, out = submit_quiz(API_URL, API_TOKEN, quiz_id, answers)
+                return (
+                    {"error": "All questions must be attempted before submission"},
+                    cfg,
+                )
+            ok, out = await submit_quiz(quiz_id, answers)
+            _invalidate("quizzes")
             if not ok:
-                return {"error": out}
-            return out
+                return {"error": out}, cfg
+            # The quiz is no longer active; drop the memoized rows so
+            # re-selecting it reloads instead of short-circuiting.
+            new_cfg = cfg.copy()
+            new_cfg["last_quiz_rows"] = None
+            return out, new_cfg
 
         submit_quiz_btn.click(
-            _submit_quiz, inputs=[cfg_state, active_quiz_df], outputs=submit_result_box
+            _submit_quiz,
+            inputs=[cfg_state, active_quiz_df],
+            outputs=[submit_result_box, cfg_state],
         )
 
         completed_quiz_selector = gr.Dropdown(
@@ -547,54 +776,104 @@ with gr.Blocks(title="ConceptCycle", theme=gr.themes.Ocean()) as client:
         )
         refresh_completed_quizzes_btn = gr.Button("Refresh completed quizzes")
 
-        def _refresh_completed_quizzes(_cfg):
-            quizzes = [
-                q
-                for q in list_quizzes(API_URL, API_TOKEN)
-                if q.get("status") == "completed"
-            ]
-            choices = [_format_quiz_choice(q) for q in quizzes]
-            return gr.update(choices=choices, value=choices[0] if choices else None)
-
-        refresh_completed_quizzes_btn.click(
-            _refresh_completed_quizzes,
-            inputs=cfg_state,
-            outputs=completed_quiz_selector,
-        )
-
         completed_quiz_df = gr.Dataframe(
             headers=["question", "response", "grade", "feedback"],
             datatype=["str", "str", "int", "str"],
+            row_count=(0, "dynamic"),
+            col_count=("fixed", 4),
+            max_height=500,
             interactive=False,
             label="Completed quiz info",
         )
 
-        def _load_completed_quiz(_cfg, sel_q_display):
-            if not sel_q_display:
-                return gr.update(value=[])
-            qid = _extract_id_from_display(sel_q_display)
+        async def _load_completed_quiz(cfg, qid):
+            if not qid:
+                return gr.update(value=[]), cfg
+            if qid == cfg.get("last_completed_quiz_id") and cfg.get(
+                "last_completed_rows"
+            ):
+                return gr.update(), cfg
             try:
-                data = get_quiz_by_id(API_URL, API_TOKEN, qid)
+                data = await get_quiz_by_id(qid)
             except Exception:
-                return gr.update(value=[])
-            rows = []
-            for q in data.get("questions", []):
-                rows.append(
-                    [
-                        q.get("question", ""),
-                        q.get("response", ""),
-                        q.get("grade", ""),
-                        q.get("feedback", ""),
-                    ]
-                )
-            return gr.update(value=rows)
+                return gr.update(value=[]), cfg
+            rows = [
+                [
+                    q.question,
+                    q.response,
+                    "" if q.grade is None else q.grade,
+                    q.feedback,
+                ]
+                for q in data.questions
+            ]
+            new_cfg = cfg.copy()
+            new_cfg["last_completed_quiz_id"] = qid
+            new_cfg["last_completed_rows"] = rows
+            return gr.update(value=rows), new_cfg
 
         completed_quiz_selector.change(
             _load_completed_quiz,
             inputs=[cfg_state, completed_quiz_selector],
-            outputs=[completed_quiz_df],
+            outputs=[completed_quiz_df, cfg_state],
         )
 
+    # Single refresh pipeline: one gather for notes + quizzes, fanned out
+    # to every tab's dropdowns. Every refresh button (global and per-tab)
+    # and the page-load prefetch all go through here, so a full manual
+    # refresh costs one concurrent pair of fetches instead of five
+    # sequential round-trips.
+    async def _refresh_all(cfg):
+        notes, quizzes = await asyncio.gather(list_notes(), list_quizzes())
+        new_cfg = cfg.copy()
+        new_cfg["notes"] = notes
+        note_choices = _format_note_choices(notes)
+        rows = [[n[1], n[2]] for n in notes]
+        active = [
+            _format_quiz_choice(q) for q in quizzes if q.status == "active"
+        ]
+        completed = [
+            _format_quiz_choice(q) for q in quizzes if q.status == "completed"
+        ]
+        return (
+            new_cfg,
+            rows,
+            gr.update(
+                choices=note_choices, value=note_choices[0][1] if note_choices else None
+            ),
+            gr.update(
+                choices=note_choices, value=note_choices[0][1] if note_choices else None
+            ),
+            gr.update(choices=note_choices, value=None),
+            gr.update(choices=active, value=active[0][1] if active else None),
+            gr.update(
+                choices=completed, value=completed[0][1] if completed else None
+            ),
+        )
+
+    _refresh_outputs = [
+        cfg_state,
+        notes_df,
+        selected_note,
+        concept_note_selector,
+        quiz_note_selector,
+        active_quiz_selector,
+        completed_quiz_selector,
+    ]
+
+    for _btn in (
+        refresh_all_btn,
+        list_notes_btn,
+        refresh_concept_notes,
+        refresh_quiz_notes,
+        refresh_active_quizzes_btn,
+        refresh_completed_quizzes_btn,
+    ):
+        _btn.click(_refresh_all, inputs=cfg_state, outputs=_refresh_outputs)
+
+    # Prefetch on page load so the first interaction already sees populated
+    # dropdowns (and warm TTL caches) instead of requiring a manual refresh.
+    client.load(_refresh_all, inputs=cfg_state, outputs=_refresh_outputs)
+
     # # Footer
     # with gr.Row():
     #     gr.Markdown(
@@ -608,5 +887,16 @@ with gr.Blocks(title="ConceptCycle", theme=gr.themes.Ocean()) as client:
     #     )
 
 if __name__ == "__main__":
-    client.queue()
-    client.launch(share=False, favicon_path="conceptcycle.jpg")
+    # Callbacks are async and I/O-bound (they mostly await the backend), so
+    # let plenty of them overlap on the event loop instead of serializing.
+    client.queue(default_concurrency_limit=16, max_size=64)
+    client.launch(
+        share=False,
+        favicon_path="conceptcycle.jpg",
+        # gzip large JSON responses (concept/quiz payloads) to the browser;
+        # small bodies are left alone.
+        app_kwargs={
+            "middleware": [Middleware(GZipMiddleware, minimum_size=1024)],
+            "lifespan": _lifespan,
+        },
+    )